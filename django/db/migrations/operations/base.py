@@ -31,6 +31,12 @@ class Operation(object):
 
     serialization_expand_args = []
 
+    # Operations are instantiated in their thousands on big projects, so
+    # subclasses may declare __slots__ to shrink them and speed up attribute
+    # access. _constructor_args is set by __new__ and _auto_deps is attached
+    # by the autodetector, so both are declared here.
+    __slots__ = ('_constructor_args', '_auto_deps')
+
     def __new__(cls, *args, **kwargs):
         # We capture the arguments to make returning them trivial
         self = object.__new__(cls)
@@ -103,9 +109,15 @@ class Operation(object):
         Returns if we're allowed to migrate the model.
         """
         # Always skip if proxy, swapped out, or unmanaged.
-        if model and (model._meta.proxy or model._meta.swapped or not model._meta.managed):
-            return False
-
+        if model:
+            meta = model._meta
+            if meta.proxy or meta.swapped or not meta.managed:
+                return False
+
+        # Without any routers installed there's nothing that could veto the
+        # migration, so skip consulting the router entirely (the common case).
+        if not router.routers:
+            return True
         return router.allow_migrate(connection_alias, model, **(hints or {}))
 
     def __repr__(self):
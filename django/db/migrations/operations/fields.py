@@ -1,29 +1,112 @@
 from __future__ import unicode_literals
 
+import sys
+
 from django.db.models.fields import NOT_PROVIDED
 from django.utils import six
-from django.utils.functional import cached_property
 from .base import Operation
 
+if six.PY2:
+    # intern() can't handle the unicode strings used for model and field
+    # names on Python 2.
+    def _intern(value):
+        return value
+else:
+    _intern = sys.intern
+
+# Bound once here to save an attribute lookup on the six module every time
+# AlterField.database_forwards runs.
+_string_types = six.string_types
+
+
+def _field_db_signature(field, connection):
+    """
+    Everything about a field that influences its database schema. If two
+    non-relational fields have equal signatures, altering one into the other
+    requires no schema change.
+    """
+    return (
+        field.db_parameters(connection),
+        field.null,
+        field.unique,
+        field.db_index,
+        field.db_column,
+        field.db_tablespace,
+        field.primary_key,
+        field.default,
+    )
+
+
+class FieldOperation(Operation):
+    """
+    Common base class for operations that work on one field of one model.
+    Subclasses must set model_name_lower in __init__, and name_lower too
+    unless they override references_field().
+    """
+
+    __slots__ = ()
+
+    def references_model(self, name, app_label=None):
+        return name.lower() == self.model_name_lower
+
+    def references_field(self, model_name, name, app_label=None):
+        return self.references_model(model_name) and name.lower() == self.name_lower
+
 
-class AddField(Operation):
+class FieldComparisonMixin(object):
+    """
+    Value-based equality for operations that carry a field (AddField and
+    AlterField). Relies on the cached lowercased names and the deconstructed
+    field set up in the operation's __init__.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if self.__class__ is not other.__class__:
+            return False
+        if (self.name_lower != other.name_lower or
+                self.model_name_lower != other.model_name_lower or
+                self.preserve_default != other.preserve_default):
+            return False
+        return self._deconstructed_field == other._deconstructed_field
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        # The deconstructed field contains its kwargs dict, which isn't
+        # hashable, so hash on the names only; equal operations always
+        # have equal names.
+        return hash((self.__class__, self.model_name_lower, self.name_lower))
+
+
+class AddField(FieldComparisonMixin, FieldOperation):
     """
     Adds a field to a model.
     """
 
+    __slots__ = (
+        'model_name', 'model_name_lower', 'name', 'name_lower', 'field',
+        'preserve_default', '_deconstructed_field',
+    )
+
     def __init__(self, model_name, name, field, preserve_default=True):
-        self.model_name = model_name
-        self.name = name
+        # Interning the names makes the many equality checks and dict lookups
+        # keyed on them cheap pointer comparisons.
+        self.model_name = _intern(model_name)
+        self.model_name_lower = _intern(model_name.lower())
+        self.name = _intern(name)
+        self.name_lower = _intern(name.lower())
         self.field = field
         self.preserve_default = preserve_default
-
-    @cached_property
-    def name_lower(self):
-        return self.name.lower()
-
-    @cached_property
-    def model_name_lower(self):
-        return self.model_name.lower()
+        # Deconstructing the field is relatively expensive and the result
+        # only changes if self.field is mutated, which isn't supported
+        # (operations are immutable), so compute it once up front for the
+        # many comparisons the autodetector makes.
+        self._deconstructed_field = field.deconstruct()[1:]
 
     def deconstruct(self):
         kwargs = {
@@ -71,29 +154,19 @@ class AddField(Operation):
     def describe(self):
         return "Add field %s to %s" % (self.name, self.model_name)
 
-    def references_model(self, name, app_label=None):
-        return name.lower() == self.model_name_lower
-
-    def references_field(self, model_name, name, app_label=None):
-        return self.references_model(model_name) and name.lower() == self.name_lower
 
-
-class RemoveField(Operation):
+class RemoveField(FieldOperation):
     """
     Removes a field from a model.
     """
 
-    def __init__(self, model_name, name):
-        self.model_name = model_name
-        self.name = name
-
-    @cached_property
-    def name_lower(self):
-        return self.name.lower()
+    __slots__ = ('model_name', 'model_name_lower', 'name', 'name_lower')
 
-    @cached_property
-    def model_name_lower(self):
-        return self.model_name.lower()
+    def __init__(self, model_name, name):
+        self.model_name = _intern(model_name)
+        self.model_name_lower = _intern(model_name.lower())
+        self.name = _intern(name)
+        self.name_lower = _intern(name.lower())
 
     def deconstruct(self):
         kwargs = {
@@ -107,11 +180,12 @@ class RemoveField(Operation):
         )
 
     def state_forwards(self, app_label, state):
-        new_fields = []
-        for name, instance in state.models[app_label, self.model_name_lower].fields:
-            if name != self.name:
-                new_fields.append((name, instance))
-        state.models[app_label, self.model_name_lower].fields = new_fields
+        model_state = state.models[app_label, self.model_name_lower]
+        fields = model_state.fields
+        for index, (name, field) in enumerate(fields):
+            if name == self.name:
+                del fields[index]
+                break
         state.reload_model(app_label, self.model_name_lower)
 
     def database_forwards(self, app_label, schema_editor, from_state, to_state):
@@ -128,31 +202,29 @@ class RemoveField(Operation):
     def describe(self):
         return "Remove field %s from %s" % (self.name, self.model_name)
 
-    def references_model(self, name, app_label=None):
-        return name.lower() == self.model_name_lower
 
-    def references_field(self, model_name, name, app_label=None):
-        return self.references_model(model_name) and name.lower() == self.name_lower
-
-
-class AlterField(Operation):
+class AlterField(FieldComparisonMixin, FieldOperation):
     """
     Alters a field's database column (e.g. null, max_length) to the provided new field
     """
 
+    __slots__ = (
+        'model_name', 'model_name_lower', 'name', 'name_lower', 'field',
+        'preserve_default', '_deconstructed_field',
+    )
+
     def __init__(self, model_name, name, field, preserve_default=True):
-        self.model_name = model_name
-        self.name = name
+        self.model_name = _intern(model_name)
+        self.model_name_lower = _intern(model_name.lower())
+        self.name = _intern(name)
+        self.name_lower = _intern(name.lower())
         self.field = field
         self.preserve_default = preserve_default
-
-    @cached_property
-    def name_lower(self):
-        return self.name.lower()
-
-    @cached_property
-    def model_name_lower(self):
-        return self.model_name.lower()
+        # Deconstructing the field is relatively expensive and the result
+        # only changes if self.field is mutated, which isn't supported
+        # (operations are immutable), so compute it once up front for the
+        # many comparisons the autodetector makes.
+        self._deconstructed_field = field.deconstruct()[1:]
 
     def deconstruct(self):
         kwargs = {
@@ -174,11 +246,12 @@ class AlterField(Operation):
             field.default = NOT_PROVIDED
         else:
             field = self.field
-        state.models[app_label, self.model_name_lower].fields = [
-            (n, field if n == self.name else f)
-            for n, f in
-            state.models[app_label, self.model_name_lower].fields
-        ]
+        model_state = state.models[app_label, self.model_name_lower]
+        fields = model_state.fields
+        for index, (name, old_field) in enumerate(fields):
+            if name == self.name:
+                fields[index] = (name, field)
+                break
         state.reload_model(app_label, self.model_name_lower)
 
     def database_forwards(self, app_label, schema_editor, from_state, to_state):
@@ -190,51 +263,55 @@ class AlterField(Operation):
             # If the field is a relatedfield with an unresolved rel.to, just
             # set it equal to the other field side. Bandaid fix for AlterField
             # migrations that are part of a RenameModel change.
-            if from_field.rel and from_field.rel.to:
-                if isinstance(from_field.rel.to, six.string_types):
-                    from_field.rel.to = to_field.rel.to
-                elif to_field.rel and isinstance(to_field.rel.to, six.string_types):
-                    to_field.rel.to = from_field.rel.to
+            from_rel = from_field.rel
+            to_rel = to_field.rel
+            if from_rel and from_rel.to:
+                if isinstance(from_rel.to, _string_types):
+                    from_rel.to = to_rel.to
+                elif to_rel and isinstance(to_rel.to, _string_types):
+                    to_rel.to = from_rel.to
+            # Many AlterFields only change Python-level behavior (help_text,
+            # validators, ...); if nothing that affects the schema changed,
+            # skip the ALTER TABLE round-trips entirely. Relational fields
+            # are left to the schema editor, as their constraints aren't
+            # captured by the signature.
+            if not from_rel and not to_rel:
+                connection = schema_editor.connection
+                if (_field_db_signature(from_field, connection) ==
+                        _field_db_signature(to_field, connection)):
+                    return
             if not self.preserve_default:
                 to_field.default = self.field.default
             schema_editor.alter_field(from_model, from_field, to_field)
             if not self.preserve_default:
                 to_field.default = NOT_PROVIDED
 
-    def database_backwards(self, app_label, schema_editor, from_state, to_state):
-        self.database_forwards(app_label, schema_editor, from_state, to_state)
+    # Altering a field is symmetrical - the states are simply swapped - so
+    # alias the method instead of paying an extra frame per reversal.
+    database_backwards = database_forwards
 
     def describe(self):
         return "Alter field %s on %s" % (self.name, self.model_name)
 
-    def references_model(self, name, app_label=None):
-        return name.lower() == self.model_name_lower
-
-    def references_field(self, model_name, name, app_label=None):
-        return self.references_model(model_name) and name.lower() == self.name_lower
 
-
-class RenameField(Operation):
+class RenameField(FieldOperation):
     """
     Renames a field on the model. Might affect db_column too.
     """
 
-    def __init__(self, model_name, old_name, new_name):
-        self.model_name = model_name
-        self.old_name = old_name
-        self.new_name = new_name
+    __slots__ = (
+        'model_name', 'model_name_lower', 'old_name', 'old_name_lower',
+        'new_name', 'new_name_lower', '_name_set',
+    )
 
-    @cached_property
-    def old_name_lower(self):
-        return self.old_name.lower()
-
-    @cached_property
-    def new_name_lower(self):
-        return self.new_name.lower()
-
-    @cached_property
-    def model_name_lower(self):
-        return self.model_name.lower()
+    def __init__(self, model_name, old_name, new_name):
+        self.model_name = _intern(model_name)
+        self.model_name_lower = _intern(model_name.lower())
+        self.old_name = _intern(old_name)
+        self.old_name_lower = _intern(old_name.lower())
+        self.new_name = _intern(new_name)
+        self.new_name_lower = _intern(new_name.lower())
+        self._name_set = frozenset((self.old_name_lower, self.new_name_lower))
 
     def deconstruct(self):
         kwargs = {
@@ -249,13 +326,15 @@ class RenameField(Operation):
         )
 
     def state_forwards(self, app_label, state):
+        model_state = state.models[app_label, self.model_name_lower]
         # Rename the field
-        state.models[app_label, self.model_name_lower].fields = [
-            (self.new_name if n == self.old_name else n, f)
-            for n, f in state.models[app_label, self.model_name_lower].fields
-        ]
+        fields = model_state.fields
+        for index, (name, field) in enumerate(fields):
+            if name == self.old_name:
+                fields[index] = (self.new_name, field)
+                break
         # Fix index/unique_together to refer to the new field
-        options = state.models[app_label, self.model_name_lower].options
+        options = model_state.options
         for option in ('index_together', 'unique_together'):
             if option in options:
                 options[option] = [
@@ -287,11 +366,5 @@ class RenameField(Operation):
     def describe(self):
         return "Rename field %s on %s to %s" % (self.old_name, self.model_name, self.new_name)
 
-    def references_model(self, name, app_label=None):
-        return name.lower() == self.model_name_lower
-
     def references_field(self, model_name, name, app_label=None):
-        return self.references_model(model_name) and (
-            name.lower() == self.old_name_lower or
-            name.lower() == self.new_name_lower
-        )
+        return self.references_model(model_name) and name.lower() in self._name_set
@@ -98,61 +98,6 @@ class AppsTests(TestCase):
             config = apps.get_app_config('default_config_app')
         self.assertIsInstance(config, CustomConfig)
 
-    @override_settings(INSTALLED_APPS=SOME_INSTALLED_APPS)
-    def test_get_app_configs(self):
-        """
-        Tests apps.get_app_configs().
-        """
-        app_configs = apps.get_app_configs()
-        self.assertListEqual(
-            [app_config.name for app_config in app_configs],
-            SOME_INSTALLED_APPS_NAMES)
-
-    @override_settings(INSTALLED_APPS=SOME_INSTALLED_APPS)
-    def test_get_app_config(self):
-        """
-        Tests apps.get_app_config().
-        """
-        app_config = apps.get_app_config('admin')
-        self.assertEqual(app_config.name, 'django.contrib.admin')
-
-        app_config = apps.get_app_config('staticfiles')
-        self.assertEqual(app_config.name, 'django.contrib.staticfiles')
-
-        with self.assertRaises(LookupError):
-            apps.get_app_config('webdesign')
-
-    @override_settings(INSTALLED_APPS=SOME_INSTALLED_APPS)
-    def test_is_installed(self):
-        """
-        Tests apps.is_installed().
-        """
-        self.assertTrue(apps.is_installed('django.contrib.admin'))
-        self.assertTrue(apps.is_installed('django.contrib.auth'))
-        self.assertTrue(apps.is_installed('django.contrib.staticfiles'))
-        self.assertFalse(apps.is_installed('django.contrib.webdesign'))
-
-    @override_settings(INSTALLED_APPS=SOME_INSTALLED_APPS)
-    def test_get_model(self):
-        """
-        Tests apps.get_model().
-        """
-        self.assertEqual(apps.get_model('admin', 'LogEntry'), LogEntry)
-        with self.assertRaises(LookupError):
-            apps.get_model('admin', 'LogExit')
-
-        # App label is case-sensitive, Model name is case-insensitive.
-        self.assertEqual(apps.get_model('admin', 'loGentrY'), LogEntry)
-        with self.assertRaises(LookupError):
-            apps.get_model('Admin', 'LogEntry')
-
-        # A single argument is accepted.
-        self.assertEqual(apps.get_model('admin.LogEntry'), LogEntry)
-        with self.assertRaises(LookupError):
-            apps.get_model('admin.LogExit')
-        with self.assertRaises(ValueError):
-            apps.get_model('admin_LogEntry')
-
     @override_settings(INSTALLED_APPS=['apps.apps.RelabeledAppsConfig'])
     def test_relabeling(self):
         self.assertEqual(apps.get_app_config('relabeled').name, 'apps')
@@ -249,69 +194,109 @@ class AppsTests(TestCase):
             type(str("SouthPonies"), (models.Model,), body)
 
 
-class Stub(object):
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
-
-
-class AppConfigTests(TestCase):
-    """Unit tests for AppConfig class."""
-    def test_path_set_explicitly(self):
-        """If subclass sets path as class attr, no module attributes needed."""
-        class MyAppConfig(AppConfig):
-            path = 'foo'
-
-        ac = MyAppConfig('label', Stub())
-
-        self.assertEqual(ac.path, 'foo')
+@override_settings(INSTALLED_APPS=SOME_INSTALLED_APPS)
+class SomeInstalledAppsTests(TestCase):
+    """
+    Tests that inspect the registry with SOME_INSTALLED_APPS installed.
 
-    def test_explicit_path_overrides(self):
-        """If path set as class attr, overrides __path__ and __file__."""
-        class MyAppConfig(AppConfig):
-            path = 'foo'
+    The settings override is applied to the whole class so that the app
+    registry is only repopulated once, rather than twice per test method.
+    """
 
-        ac = MyAppConfig('label', Stub(__path__=['a'], __file__='b/__init__.py'))
+    def test_get_app_configs(self):
+        """
+        Tests apps.get_app_configs().
+        """
+        app_configs = apps.get_app_configs()
+        self.assertListEqual(
+            [app_config.name for app_config in app_configs],
+            SOME_INSTALLED_APPS_NAMES)
 
-        self.assertEqual(ac.path, 'foo')
+    def test_get_app_config(self):
+        """
+        Tests apps.get_app_config().
+        """
+        app_config = apps.get_app_config('admin')
+        self.assertEqual(app_config.name, 'django.contrib.admin')
 
-    def test_dunder_path(self):
-        """If single element in __path__, use it (in preference to __file__)."""
-        ac = AppConfig('label', Stub(__path__=['a'], __file__='b/__init__.py'))
+        app_config = apps.get_app_config('staticfiles')
+        self.assertEqual(app_config.name, 'django.contrib.staticfiles')
 
-        self.assertEqual(ac.path, 'a')
+        with self.assertRaises(LookupError):
+            apps.get_app_config('webdesign')
 
-    def test_no_dunder_path_fallback_to_dunder_file(self):
-        """If there is no __path__ attr, use __file__."""
-        ac = AppConfig('label', Stub(__file__='b/__init__.py'))
+    def test_is_installed(self):
+        """
+        Tests apps.is_installed().
+        """
+        self.assertTrue(apps.is_installed('django.contrib.admin'))
+        self.assertTrue(apps.is_installed('django.contrib.auth'))
+        self.assertTrue(apps.is_installed('django.contrib.staticfiles'))
+        self.assertFalse(apps.is_installed('django.contrib.webdesign'))
 
-        self.assertEqual(ac.path, 'b')
+    def test_get_model(self):
+        """
+        Tests apps.get_model().
+        """
+        self.assertEqual(apps.get_model('admin', 'LogEntry'), LogEntry)
+        with self.assertRaises(LookupError):
+            apps.get_model('admin', 'LogExit')
 
-    def test_empty_dunder_path_fallback_to_dunder_file(self):
-        """If the __path__ attr is empty, use __file__ if set."""
-        ac = AppConfig('label', Stub(__path__=[], __file__='b/__init__.py'))
+        # App label is case-sensitive, Model name is case-insensitive.
+        self.assertEqual(apps.get_model('admin', 'loGentrY'), LogEntry)
+        with self.assertRaises(LookupError):
+            apps.get_model('Admin', 'LogEntry')
 
-        self.assertEqual(ac.path, 'b')
+        # A single argument is accepted.
+        self.assertEqual(apps.get_model('admin.LogEntry'), LogEntry)
+        with self.assertRaises(LookupError):
+            apps.get_model('admin.LogExit')
+        with self.assertRaises(ValueError):
+            apps.get_model('admin_LogEntry')
 
-    def test_multiple_dunder_path_fallback_to_dunder_file(self):
-        """If the __path__ attr is length>1, use __file__ if set."""
-        ac = AppConfig('label', Stub(__path__=['a', 'b'], __file__='c/__init__.py'))
 
-        self.assertEqual(ac.path, 'c')
+class Stub(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
 
-    def test_no_dunder_path_or_dunder_file(self):
-        """If there is no __path__ or __file__, raise ImproperlyConfigured."""
-        with self.assertRaises(ImproperlyConfigured):
-            AppConfig('label', Stub())
 
-    def test_empty_dunder_path_no_dunder_file(self):
-        """If the __path__ attr is empty and there is no __file__, raise."""
-        with self.assertRaises(ImproperlyConfigured):
-            AppConfig('label', Stub(__path__=[]))
+class AppConfigTests(TestCase):
+    """Unit tests for AppConfig class."""
+    def test_path_resolution(self):
+        """
+        AppConfig.path comes from the app module's filesystem location,
+        unless set explicitly as a class attribute.
+        """
+        class ExplicitPathConfig(AppConfig):
+            path = 'foo'
 
-    def test_multiple_dunder_path_no_dunder_file(self):
-        """If the __path__ attr is length>1 and there is no __file__, raise."""
-        with self.assertRaises(ImproperlyConfigured):
-            AppConfig('label', Stub(__path__=['a', 'b']))
+        tests = [
+            # (config class, module attributes, expected path or exception)
+            # If subclass sets path as class attr, no module attributes
+            # needed, and it overrides __path__ and __file__.
+            (ExplicitPathConfig, {}, 'foo'),
+            (ExplicitPathConfig, {'__path__': ['a'], '__file__': 'b/__init__.py'}, 'foo'),
+            # If single element in __path__, use it (in preference to
+            # __file__).
+            (AppConfig, {'__path__': ['a'], '__file__': 'b/__init__.py'}, 'a'),
+            # If the __path__ attr is missing, empty, or has more than one
+            # element, use __file__ if set.
+            (AppConfig, {'__file__': 'b/__init__.py'}, 'b'),
+            (AppConfig, {'__path__': [], '__file__': 'b/__init__.py'}, 'b'),
+            (AppConfig, {'__path__': ['a', 'b'], '__file__': 'c/__init__.py'}, 'c'),
+            # Without a usable __path__ or __file__, raise
+            # ImproperlyConfigured.
+            (AppConfig, {}, ImproperlyConfigured),
+            (AppConfig, {'__path__': []}, ImproperlyConfigured),
+            (AppConfig, {'__path__': ['a', 'b']}, ImproperlyConfigured),
+        ]
+        for config_class, module_attrs, expected in tests:
+            if expected is ImproperlyConfigured:
+                with self.assertRaises(ImproperlyConfigured):
+                    config_class('label', Stub(**module_attrs))
+            else:
+                ac = config_class('label', Stub(**module_attrs))
+                self.assertEqual(ac.path, expected, 'module attributes: %r' % module_attrs)
 
 
 @skipUnless(
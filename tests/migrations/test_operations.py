@@ -13,7 +13,7 @@ from django.db.migrations.state import ProjectState
 from django.db.models.fields import NOT_PROVIDED
 from django.db.transaction import atomic
 from django.db.utils import IntegrityError
-from django.test import override_settings
+from django.test import SimpleTestCase, mock, override_settings
 from django.utils import six
 
 from .models import FoodManager, FoodQuerySet
@@ -1033,6 +1033,30 @@ class OperationTests(OperationTestBase):
         self.assertEqual(definition[1], [])
         self.assertEqual(sorted(definition[2]), ["field", "model_name", "name"])
 
+    def test_alter_field_no_db_change(self):
+        """
+        An AlterField that only changes Python-level behavior (help_text,
+        verbose_name, ...) doesn't touch the database.
+        """
+        project_state = self.set_up_test_model("test_alflnop")
+
+        def alter_field_call_count(field):
+            operation = migrations.AlterField("Pony", "pink", field)
+            new_state = project_state.clone()
+            operation.state_forwards("test_alflnop", new_state)
+            with connection.schema_editor() as editor:
+                with mock.patch.object(editor, 'alter_field') as alter_field:
+                    operation.database_forwards("test_alflnop", editor, project_state, new_state)
+            return alter_field.call_count
+
+        # help_text and verbose_name don't affect the schema.
+        self.assertEqual(alter_field_call_count(models.IntegerField(default=3, help_text="help")), 0)
+        self.assertEqual(alter_field_call_count(models.IntegerField(default=3, verbose_name="Pink")), 0)
+        # null, db_index, and type changes still alter the schema.
+        self.assertEqual(alter_field_call_count(models.IntegerField(default=3, null=True)), 1)
+        self.assertEqual(alter_field_call_count(models.IntegerField(default=3, db_index=True)), 1)
+        self.assertEqual(alter_field_call_count(models.BigIntegerField(default=3)), 1)
+
     def test_alter_field_pk(self):
         """
         Tests the AlterField operation on primary keys (for things like PostgreSQL's SERIAL weirdness)
@@ -1791,3 +1815,55 @@ class SwappableOperationTests(OperationTestBase):
         with connection.schema_editor() as editor:
             operation.database_backwards("test_adfligsw", editor, new_state, project_state)
         self.assertTableNotExists("test_adfligsw_pony")
+
+
+class FieldOperationComparisonTests(SimpleTestCase):
+    """
+    Tests the value-based comparison of AddField and AlterField.
+    """
+
+    def test_equal_ignores_name_case(self):
+        self.assertEqual(
+            migrations.AddField("Pony", "pink", models.IntegerField(default=1)),
+            migrations.AddField("poNY", "PInk", models.IntegerField(default=1)),
+        )
+        self.assertEqual(
+            migrations.AlterField("Pony", "pink", models.IntegerField(null=True)),
+            migrations.AlterField("pony", "Pink", models.IntegerField(null=True)),
+        )
+
+    def test_not_equal_preserve_default(self):
+        self.assertNotEqual(
+            migrations.AddField("Pony", "pink", models.IntegerField(default=1)),
+            migrations.AddField("Pony", "pink", models.IntegerField(default=1), preserve_default=False),
+        )
+
+    def test_not_equal_field_arguments(self):
+        self.assertNotEqual(
+            migrations.AddField("Pony", "pink", models.IntegerField(default=1)),
+            migrations.AddField("Pony", "pink", models.IntegerField(default=2)),
+        )
+        self.assertNotEqual(
+            migrations.AlterField("Pony", "pink", models.IntegerField(null=True)),
+            migrations.AlterField("Pony", "pink", models.IntegerField()),
+        )
+
+    def test_not_equal_other_types(self):
+        operation = migrations.AddField("Pony", "pink", models.IntegerField(default=1))
+        self.assertNotEqual(operation, "AddField")
+        self.assertNotEqual(operation, None)
+        self.assertNotEqual(
+            operation,
+            migrations.AlterField("Pony", "pink", models.IntegerField(default=1)),
+        )
+
+    def test_hash(self):
+        """Equal operations hash alike and deduplicate in a set."""
+        operation = migrations.AddField("Pony", "pink", models.IntegerField(default=1))
+        other = migrations.AddField("poNY", "PInk", models.IntegerField(default=1))
+        self.assertEqual(hash(operation), hash(other))
+        self.assertEqual(len({operation, other}), 1)
+        operation = migrations.AlterField("Pony", "pink", models.IntegerField(null=True))
+        other = migrations.AlterField("pony", "Pink", models.IntegerField(null=True))
+        self.assertEqual(hash(operation), hash(other))
+        self.assertEqual(len({operation, other}), 1)
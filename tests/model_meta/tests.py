@@ -8,6 +8,27 @@ from django.test import TestCase
 from .models import Relation, AbstractPerson, BasePerson, Person, ProxyPerson, Relating
 from .results import TEST_RESULTS
 
+# Expected related_query_name() values for RelationTreeTests, sorted once at
+# import time rather than on every test run.
+EXPECTED_RELATION_RELATED_NAMES = sorted([
+    'fk_abstract_rel', 'fk_abstract_rel', 'fk_abstract_rel', 'fk_base_rel', 'fk_base_rel',
+    'fk_base_rel', 'fk_concrete_rel', 'fk_concrete_rel', 'fo_abstract_rel', 'fo_abstract_rel',
+    'fo_abstract_rel', 'fo_base_rel', 'fo_base_rel', 'fo_base_rel', 'fo_concrete_rel',
+    'fo_concrete_rel', 'm2m_abstract_rel', 'm2m_abstract_rel', 'm2m_abstract_rel',
+    'm2m_base_rel', 'm2m_base_rel', 'm2m_base_rel', 'm2m_concrete_rel', 'm2m_concrete_rel',
+])
+
+EXPECTED_BASEPERSON_RELATED_NAMES = sorted([
+    '+', '+', 'BasePerson_following_abstract+', 'BasePerson_following_abstract+',
+    'BasePerson_following_base+', 'BasePerson_following_base+', 'BasePerson_friends_abstract+',
+    'BasePerson_friends_abstract+', 'BasePerson_friends_base+', 'BasePerson_friends_base+',
+    'BasePerson_m2m_abstract+', 'BasePerson_m2m_base+', 'Relating_basepeople+',
+    'Relating_basepeople_hidden+', 'followers_abstract', 'followers_abstract', 'followers_abstract',
+    'followers_base', 'followers_base', 'followers_base', 'friends_abstract_rel_+', 'friends_abstract_rel_+',
+    'friends_abstract_rel_+', 'friends_base_rel_+', 'friends_base_rel_+', 'friends_base_rel_+', 'person',
+    'person', 'relating_basepeople', 'relating_baseperson',
+])
+
 
 class OptionsBaseTests(TestCase):
 
@@ -226,28 +247,13 @@ class RelationTreeTests(TestCase):
     def test_relations_related_objects(self):
         # Testing non hidden related objects
         self.assertEqual(
-            sorted([field.related_query_name() for field in Relation._meta._relation_tree
-                   if not field.rel.field.rel.is_hidden()]),
-            sorted([
-                'fk_abstract_rel', 'fk_abstract_rel', 'fk_abstract_rel', 'fk_base_rel', 'fk_base_rel',
-                'fk_base_rel', 'fk_concrete_rel', 'fk_concrete_rel', 'fo_abstract_rel', 'fo_abstract_rel',
-                'fo_abstract_rel', 'fo_base_rel', 'fo_base_rel', 'fo_base_rel', 'fo_concrete_rel',
-                'fo_concrete_rel', 'm2m_abstract_rel', 'm2m_abstract_rel', 'm2m_abstract_rel',
-                'm2m_base_rel', 'm2m_base_rel', 'm2m_base_rel', 'm2m_concrete_rel', 'm2m_concrete_rel',
-            ])
+            sorted(field.related_query_name() for field in Relation._meta._relation_tree
+                   if not field.rel.field.rel.is_hidden()),
+            EXPECTED_RELATION_RELATED_NAMES,
         )
         # Testing hidden related objects
         self.assertEqual(
-            sorted([field.related_query_name() for field in BasePerson._meta._relation_tree]),
-            sorted([
-                '+', '+', 'BasePerson_following_abstract+', 'BasePerson_following_abstract+',
-                'BasePerson_following_base+', 'BasePerson_following_base+', 'BasePerson_friends_abstract+',
-                'BasePerson_friends_abstract+', 'BasePerson_friends_base+', 'BasePerson_friends_base+',
-                'BasePerson_m2m_abstract+', 'BasePerson_m2m_base+', 'Relating_basepeople+',
-                'Relating_basepeople_hidden+', 'followers_abstract', 'followers_abstract', 'followers_abstract',
-                'followers_base', 'followers_base', 'followers_base', 'friends_abstract_rel_+', 'friends_abstract_rel_+',
-                'friends_abstract_rel_+', 'friends_base_rel_+', 'friends_base_rel_+', 'friends_base_rel_+', 'person',
-                'person', 'relating_basepeople', 'relating_baseperson',
-            ])
+            sorted(field.related_query_name() for field in BasePerson._meta._relation_tree),
+            EXPECTED_BASEPERSON_RELATED_NAMES,
         )
         self.assertEqual([field.related_query_name() for field in AbstractPerson._meta._relation_tree], [])